@@ -26,10 +26,13 @@ import sys
 import os
 import subprocess
 import argparse
+import codecs
 import pty
-import select
+import selectors
 import time
 import signal
+import shlex
+import shutil
 import termios
 import tty
 import re
@@ -45,6 +48,83 @@ except ImportError:
     print("Make sure mdsh.py is in the same directory")
     sys.exit(1)
 
+# Precompiled patterns shared across analyses
+_ANSI_SEQ_RE = re.compile(
+    r'\x1b(?:'
+    r'\[[0-?]*[ -/]*[@-~]|'  # CSI sequences
+    r'\][^\x07]*\x07|'       # OSC sequences
+    r'[PX^_][^\x1b\x07]*\x07|'  # Other string sequences
+    r'[@-Z\\-_]'             # Single character sequences
+    r')'
+)
+_UNSAFE_CHARS = re.compile(r'[^\w\s-]', re.ASCII)
+_WS_RE = re.compile(r'\s+', re.ASCII)
+
+# Bytes requested per os.read() on the PTY master
+_READ_CHUNK = 65536
+
+# Buffer size for log files, large enough that most logs go out in one write
+_LOG_BUFFER_SIZE = 1 << 20
+
+# Printable ASCII maps to itself, everything else to '.' for the hex dump
+_ASCII_TBL = bytes(c if 32 <= c <= 126 else 0x2E for c in range(256))
+
+# Control characters (except newline, CR and tab) shown as their repr() in interactive mode
+_CTRL_TABLE = {i: repr(chr(i)) for i in range(32) if chr(i) not in '\n\r\t'}
+
+# Characters that mean a command needs bash to interpret it
+_SHELL_METACHARS = frozenset(';&|<>()$`*?[]{}~!#\n')
+
+# Bash builtins whose behavior differs from (or has no) standalone executable
+_SHELL_BUILTINS = frozenset({
+    '.', ':', '[', 'alias', 'bg', 'builtin', 'cd', 'command', 'declare', 'echo',
+    'eval', 'exec', 'exit', 'export', 'fg', 'history', 'jobs', 'kill', 'let',
+    'local', 'printf', 'pwd', 'read', 'set', 'shopt', 'source', 'test', 'time',
+    'trap', 'type', 'ulimit', 'umask', 'unset', 'wait',
+})
+
+def _command_argv(command):
+    """Return argv to run command directly, or via bash -c when it needs a shell"""
+    shell_argv = ["bash", "-c", command]
+    if not _SHELL_METACHARS.isdisjoint(command):
+        return shell_argv
+
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return shell_argv
+
+    if not argv or '=' in argv[0] or argv[0] in _SHELL_BUILTINS or not shutil.which(argv[0]):
+        return shell_argv
+
+    return argv
+
+# CSI command descriptions: (template, default parameter)
+_CSI_TEMPLATES = {
+    'A': ('Cursor Up {p} lines', '1'),
+    'B': ('Cursor Down {p} lines', '1'),
+    'C': ('Cursor Forward {p} columns', '1'),
+    'D': ('Cursor Back {p} columns', '1'),
+    'E': ('Cursor Next Line {p}', '1'),
+    'F': ('Cursor Previous Line {p}', '1'),
+    'G': ('Cursor Horizontal Absolute column {p}', '1'),
+    'J': ('Erase Display {p} (0=cursor to end, 1=start to cursor, 2=entire screen)', '0'),
+    'K': ('Erase Line {p} (0=cursor to end, 1=start to cursor, 2=entire line)', '0'),
+    'h': ('Set Mode {p}', ''),
+    'l': ('Reset Mode {p}', ''),
+}
+_CSI_STATIC = {
+    's': 'Save Cursor Position',
+    'u': 'Restore Cursor Position',
+}
+
+def _fmt_cup(params):
+    """Describe a CSI H/f (Cursor Position) sequence"""
+    parts = params.split(';', 2)
+    row = parts[0] or "1"
+    col = parts[1] if len(parts) > 1 and parts[1] else "1"
+    return f'Cursor Position row {row}, col {col}'
+
 class RawANSICapture:
     """Captures raw ANSI output from commands"""
 
@@ -55,28 +135,54 @@ class RawANSICapture:
         self.interactive_mode = interactive_mode
         self.log_dir = os.path.join(os.path.dirname(__file__), 'tmp', 'rawansi')
         self.log_buffer = []  # Buffer to capture all output for logging
+        self._out_chunks = []  # Console output pending a single stdout write
+        self._run_ts = int(time.time())  # Log filename/header timestamp, reset per analysis
 
-    def capture_command_output(self, command):
-        """Execute command and capture raw output with ANSI sequences"""
-        try:
-            # Use pty to ensure ANSI sequences are preserved
-            master, slave = pty.openpty()
+    def _spawn_on_pty(self, command, slave):
+        """Start command with stdin/stdout/stderr attached to the pty slave"""
+        argv = _command_argv(command)
+        shell_argv = ["bash", "-c", command]
 
-            # Start the command
-            process = subprocess.Popen(
-                ["bash", "-c", command],
+        def spawn(args):
+            return subprocess.Popen(
+                args,
                 stdin=slave,
                 stdout=slave,
                 stderr=slave,
-                preexec_fn=os.setsid
+                start_new_session=True
             )
 
-            os.close(slave)
+        try:
+            return spawn(argv)
+        except OSError:
+            if argv == shell_argv:
+                raise
+            # Direct exec failed (e.g. a script without a shebang); let bash run it
+            return spawn(shell_argv)
+
+    def capture_command_output(self, command):
+        """Execute command and capture raw output with ANSI sequences"""
+        try:
+            # Use pty to ensure ANSI sequences are preserved
+            master, slave = pty.openpty()
+
+            # Start the command (don't leak the pty if it can't be started)
+            try:
+                process = self._spawn_on_pty(command, slave)
+            except Exception:
+                os.close(master)
+                raise
+            finally:
+                os.close(slave)
 
-            # Capture output
-            output = b""
+            # Capture output (collect chunks, join once at the end)
+            chunks = []
             start_time = time.time()
 
+            # Register the PTY master once rather than rebuilding fd sets each tick
+            sel = selectors.DefaultSelector()
+            sel.register(master, selectors.EVENT_READ)
+
             while True:
                 # Check if process finished
                 if process.poll() is not None:
@@ -88,19 +194,20 @@ class RawANSICapture:
                     break
 
                 # Check for available data
-                ready, _, _ = select.select([master], [], [], 0.1)
+                ready = {key.fileobj for key, _ in sel.select(0.5)}
 
                 if master in ready:
                     try:
-                        data = os.read(master, 1024)
+                        data = os.read(master, _READ_CHUNK)
                         if data:
-                            output += data
+                            chunks.append(data)
                         else:
                             break
                     except OSError:
                         break
 
             # Cleanup
+            sel.close()
             try:
                 if process.poll() is None:
                     os.killpg(os.getpgid(process.pid), signal.SIGTERM)
@@ -110,6 +217,8 @@ class RawANSICapture:
 
             os.close(master)
 
+            output = b"".join(chunks)
+
             # Decode output
             try:
                 decoded_output = output.decode('utf-8', errors='replace')
@@ -137,16 +246,14 @@ class RawANSICapture:
             # Use pty to ensure ANSI sequences are preserved
             master, slave = pty.openpty()
 
-            # Start the command
-            process = subprocess.Popen(
-                ["bash", "-c", command],
-                stdin=slave,
-                stdout=slave,
-                stderr=slave,
-                preexec_fn=os.setsid
-            )
-
-            os.close(slave)
+            # Start the command (don't leak the pty if it can't be started)
+            try:
+                process = self._spawn_on_pty(command, slave)
+            except Exception:
+                os.close(master)
+                raise
+            finally:
+                os.close(slave)
 
             # Set terminal to raw mode for interactive input (only if stdin is a tty)
             old_settings = None
@@ -162,6 +269,15 @@ class RawANSICapture:
             print("🚀 Starting interactive session (Ctrl+C to exit):")
             print("─" * 60)
 
+            # Wait for input from either stdin or the process
+            sel = selectors.DefaultSelector()
+            sel.register(master, selectors.EVENT_READ)
+            if sys.stdin.isatty():
+                sel.register(sys.stdin, selectors.EVENT_READ)
+
+            # Decode incrementally so multi-byte characters split across reads survive
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
             try:
                 while True:
                     # Check if process is still running
@@ -169,9 +285,7 @@ class RawANSICapture:
                         print("\n📝 Process finished")
                         break
 
-                    # Wait for input from either stdin or the process
-                    stdin_list = [sys.stdin] if sys.stdin.isatty() else []
-                    ready, _, _ = select.select(stdin_list + [master], [], [], 0.1)
+                    ready = {key.fileobj for key, _ in sel.select(0.1)}
 
                     if sys.stdin in ready:
                         # User input - forward to process
@@ -187,27 +301,18 @@ class RawANSICapture:
                     if master in ready:
                         # Process output - show as plain text
                         try:
-                            raw_data = os.read(master, 1024)
+                            raw_data = os.read(master, _READ_CHUNK)
                             if raw_data:
                                 # Decode and show as plain text (including ANSI sequences)
-                                try:
-                                    text = raw_data.decode('utf-8', errors='replace')
-                                except:
-                                    text = raw_data.decode('latin1', errors='replace')
-
-                                # Capture the raw output for logging
-                                session_output.append(text)
+                                text = decoder.decode(raw_data)
 
                                 # Show the raw text with ANSI sequences visible
-                                # Use repr() to show escape sequences as \x1b[...
-                                for char in text:
-                                    if ord(char) < 32 and char not in ['\n', '\r', '\t']:
-                                        # Show control characters as escape sequences
-                                        print(repr(char), end='')
-                                    else:
-                                        # Show printable characters normally
-                                        print(char, end='')
+                                # Control characters are translated to their repr(), e.g. '\x1b'[...
+                                display = text.translate(_CTRL_TABLE)
 
+                                # Log the original text, show the translated one
+                                session_output.append(text)
+                                sys.stdout.write(display)
                                 sys.stdout.flush()
                             else:
                                 break
@@ -215,6 +320,8 @@ class RawANSICapture:
                             break
 
             finally:
+                sel.close()
+
                 # Restore terminal settings only if we enabled raw mode
                 if raw_mode_enabled and old_settings:
                     try:
@@ -222,6 +329,12 @@ class RawANSICapture:
                     except:
                         pass
 
+            # Flush any incomplete trailing sequence held by the decoder
+            text = decoder.decode(b'', final=True)
+            if text:
+                session_output.append(text)
+                sys.stdout.write(text.translate(_CTRL_TABLE))
+
             # Cleanup
             try:
                 if process.poll() is None:
@@ -260,18 +373,13 @@ class RawANSICapture:
 
             # Generate filename: {timestamp}_{command}.log
             timestamp = str(int(session_start_time))
-            safe_command = re.sub(r'[^\w\s-]', '', command)
-            safe_command = re.sub(r'\s+', '_', safe_command)
-            safe_command = safe_command[:50]  # Limit length
-
-            if not safe_command:
-                safe_command = "interactive"
+            safe_command = self._safe_command_slug(command, "interactive")
 
             filename = f"{timestamp}_{safe_command}.log"
             filepath = os.path.join(self.log_dir, filename)
 
             # Write session log
-            with open(filepath, 'w', encoding='utf-8') as f:
+            with open(filepath, 'w', encoding='utf-8', buffering=_LOG_BUFFER_SIZE) as f:
                 # Write header
                 f.write(f"# Interactive Raw ANSI Session Log\n")
                 f.write(f"# Generated: {datetime.fromtimestamp(session_start_time).strftime('%Y-%m-%d %H:%M:%S')}\n")
@@ -284,8 +392,7 @@ class RawANSICapture:
                 f.write("# " + "="*60 + "\n\n")
 
                 # Write all captured session output
-                for output_chunk in session_output:
-                    f.write(output_chunk)
+                f.write(''.join(session_output))
 
             print(f"📄 Session log written to: {filepath}")
             return filepath
@@ -294,12 +401,12 @@ class RawANSICapture:
             print(f"⚠️  Could not write session log: {e}")
             return None
 
-    def format_hex_dump(self, text, width=16):
-        """Create a hex dump of the text"""
+    def iter_hex_dump(self, text, width=16):
+        """Yield hex dump lines of the text one at a time"""
         if not text:
-            return "No data"
+            yield "No data"
+            return
 
-        lines = []
         data = text.encode('utf-8', errors='replace')
 
         for i in range(0, len(data), width):
@@ -310,50 +417,35 @@ class RawANSICapture:
             offset = f"{i:08x}:"
 
             # Format hex bytes
-            hex_part = " ".join(f"{b:02x}" for b in chunk)
-            hex_part = hex_part.ljust(width * 3 - 1)
+            hex_part = chunk.hex(' ').ljust(width * 3 - 1)
 
             # Format ASCII representation
-            ascii_part = ""
-            for b in chunk:
-                if 32 <= b <= 126:
-                    ascii_part += chr(b)
-                else:
-                    ascii_part += "."
+            ascii_part = chunk.translate(_ASCII_TBL).decode('ascii')
 
-            lines.append(f"{offset} {hex_part} |{ascii_part}|")
+            yield f"{offset} {hex_part} |{ascii_part}|"
 
-        return "\n".join(lines)
+    def format_hex_dump(self, text, width=16):
+        """Create a hex dump of the text"""
+        return "\n".join(self.iter_hex_dump(text, width))
 
     def find_ansi_sequences(self, text):
-        """Find and list all ANSI sequences in the text"""
-        pattern = re.compile(
-            r'\x1b(?:'
-            r'\[[0-?]*[ -/]*[@-~]|'  # CSI sequences
-            r'\][^\x07]*\x07|'       # OSC sequences
-            r'[PX^_][^\x1b\x07]*\x07|'  # Other string sequences
-            r'[@-Z\\-_]'             # Single character sequences
-            r')'
-        )
-
-        sequences = []
-        for match in pattern.finditer(text):
-            seq = match.group(0)
-            start = match.start()
-            end = match.end()
-
-            # Describe the sequence
-            description = self.describe_sequence(seq)
-
-            sequences.append({
-                'sequence': seq,
-                'start': start,
-                'end': end,
-                'description': description,
-                'repr': repr(seq)
-            })
-
-        return sequences
+        """Find all ANSI sequences in the text as (sequence, start, end) tuples"""
+        # Plain output has no ESC byte; skip the regex scan entirely
+        if '\x1b' not in text:
+            return []
+
+        return [(m.group(0), m.start(), m.end()) for m in _ANSI_SEQ_RE.finditer(text)]
+
+    def annotate_sequence(self, seq_info):
+        """Describe a (sequence, start, end) tuple from find_ansi_sequences"""
+        seq, start, end = seq_info
+        return {
+            'sequence': seq,
+            'start': start,
+            'end': end,
+            'description': self.describe_sequence(seq),
+            'repr': repr(seq)
+        }
 
     def describe_sequence(self, seq):
         """Provide human-readable description of ANSI sequence"""
@@ -369,26 +461,18 @@ class RawANSICapture:
             command = content[-1]
             params = content[:-1]
 
-            descriptions = {
-                'A': f'Cursor Up {params or "1"} lines',
-                'B': f'Cursor Down {params or "1"} lines',
-                'C': f'Cursor Forward {params or "1"} columns',
-                'D': f'Cursor Back {params or "1"} columns',
-                'E': f'Cursor Next Line {params or "1"}',
-                'F': f'Cursor Previous Line {params or "1"}',
-                'G': f'Cursor Horizontal Absolute column {params or "1"}',
-                'H': f'Cursor Position row {params.split(";")[0] if ";" in params else params or "1"}, col {params.split(";")[1] if ";" in params and len(params.split(";")) > 1 else "1"}',
-                'f': f'Cursor Position row {params.split(";")[0] if ";" in params else params or "1"}, col {params.split(";")[1] if ";" in params and len(params.split(";")) > 1 else "1"}',
-                'J': f'Erase Display {params or "0"} (0=cursor to end, 1=start to cursor, 2=entire screen)',
-                'K': f'Erase Line {params or "0"} (0=cursor to end, 1=start to cursor, 2=entire line)',
-                's': 'Save Cursor Position',
-                'u': 'Restore Cursor Position',
-                'm': f'Set Graphics Mode {params}' if params else 'Reset Graphics Mode',
-                'h': f'Set Mode {params}',
-                'l': f'Reset Mode {params}',
-            }
-
-            return descriptions.get(command, f'CSI {command} with params "{params}"')
+            if command in ('H', 'f'):
+                return _fmt_cup(params)
+
+            if command == 'm':
+                return f'Set Graphics Mode {params}' if params else 'Reset Graphics Mode'
+
+            template = _CSI_TEMPLATES.get(command)
+            if template:
+                fmt, default = template
+                return fmt.format(p=params or default)
+
+            return _CSI_STATIC.get(command, f'CSI {command} with params "{params}"')
 
         elif seq.startswith('\x1b]'):
             bell_char = '\x07'
@@ -400,47 +484,9 @@ class RawANSICapture:
     def get_real_terminal_output(self, raw_output):
         """Show what a terminal would display - the final visual result"""
         try:
-            # Create a more accurate terminal simulation
-            # Use script command to capture terminal output with proper ANSI handling
-            import tempfile
-
-            # Create a script that outputs the raw sequences
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.sh', delete=False) as f:
-                f.write('#!/bin/bash\n')
-                f.write('cat << \'EOF\'\n')
-                f.write(raw_output)
-                f.write('\nEOF\n')
-                script_file = f.name
-
-            try:
-                # Make script executable
-                os.chmod(script_file, 0o755)
-
-                # Run script and capture output with terminal processing
-                result = subprocess.run(
-                    ['bash', script_file],
-                    capture_output=True,
-                    text=False,  # Keep as bytes to preserve encoding
-                    timeout=5
-                )
-
-                if result.returncode == 0:
-                    # Decode the terminal output
-                    terminal_output = result.stdout.decode('utf-8', errors='replace')
-
-                    # Use our ANSIProcessor to show what the terminal displays
-                    # This simulates the terminal's final visual output
-                    final_display = self.processor.process_ansi_sequences(terminal_output)
-                    return final_display
-                else:
-                    error_msg = result.stderr.decode('utf-8', errors='replace')
-                    return f"Script error: {error_msg}"
-
-            finally:
-                try:
-                    os.unlink(script_file)
-                except:
-                    pass
+            # Use our ANSIProcessor to show what the terminal displays
+            # This simulates the terminal's final visual output
+            return self.processor.process_ansi_sequences(raw_output)
 
         except Exception as e:
             return f"Error creating terminal simulation: {e}"
@@ -460,6 +506,9 @@ class RawANSICapture:
                 # Split into lines and show all lines
                 lines = display_text.split('\n')
 
+                # These lines bypass log_func, so emit anything it buffered first
+                self._flush_output()
+
                 for line in lines:
                     # Show the line (this will display with actual colors if run in terminal)
                     print(f"│ {line}")
@@ -481,18 +530,26 @@ class RawANSICapture:
     def generate_log_filename(self, command):
         """Generate a safe filename for the log"""
         # Get current timestamp
-        timestamp = str(int(time.time()))
+        timestamp = str(self._run_ts)
 
-        # Create safe command name (remove/replace unsafe chars)
-        safe_command = re.sub(r'[^\w\s-]', '', command)
-        safe_command = re.sub(r'\s+', '_', safe_command)
-        safe_command = safe_command[:50]  # Limit length
-
-        if not safe_command:
-            safe_command = "command"
+        safe_command = self._safe_command_slug(command, "command")
 
         return f"{timestamp}_{safe_command}.log"
 
+    @staticmethod
+    def _safe_command_slug(command, fallback):
+        """Create safe command name for log filenames (remove/replace unsafe chars)"""
+        safe_command = _UNSAFE_CHARS.sub('', command)
+        safe_command = _WS_RE.sub('_', safe_command)[:50]  # Limit length
+        return safe_command or fallback
+
+    def _flush_output(self):
+        """Write buffered console output to stdout in one call"""
+        if self._out_chunks:
+            sys.stdout.write(''.join(self._out_chunks))
+            sys.stdout.flush()
+            self._out_chunks = []
+
     def log_output(self, text):
         """Add text to log buffer"""
         if self.enable_logging:
@@ -510,17 +567,16 @@ class RawANSICapture:
             filename = self.generate_log_filename(command)
             filepath = os.path.join(self.log_dir, filename)
 
-            with open(filepath, 'w', encoding='utf-8') as f:
+            with open(filepath, 'w', encoding='utf-8', buffering=_LOG_BUFFER_SIZE) as f:
                 # Write header
                 f.write(f"# Raw ANSI Analysis Log\n")
-                f.write(f"# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+                f.write(f"# Generated: {datetime.fromtimestamp(self._run_ts).strftime('%Y-%m-%d %H:%M:%S')}\n")
                 f.write(f"# Command: {command}\n")
-                f.write(f"# Timestamp: {int(time.time())}\n")
+                f.write(f"# Timestamp: {self._run_ts}\n")
                 f.write("# " + "="*60 + "\n\n")
 
                 # Write all captured output
-                for line in self.log_buffer:
-                    f.write(line + '\n')
+                f.write('\n'.join(self.log_buffer) + '\n')
 
             return filepath
         except Exception as e:
@@ -529,121 +585,104 @@ class RawANSICapture:
 
     def print_analysis(self, command, raw_output, returncode, show_hex=False, show_compare=True, show_real_terminal=True):
         """Print comprehensive analysis of the captured output"""
+        # show_real_terminal is accepted for compatibility but has no effect: the
+        # real terminal rendering is identical to the processed output section
 
-        # Clear log buffer for new analysis
+        # Reset buffers and timestamp for new analysis
         self.log_buffer = []
+        self._out_chunks = []
+        self._run_ts = int(time.time())
 
-        def log_print(*args, **kwargs):
-            """Print to console and capture to log buffer"""
+        def log_print(*args):
+            """Buffer for console output and capture to log buffer"""
             # Convert args to string
             text = ' '.join(str(arg) for arg in args)
-            print(text, **kwargs)
+            self._out_chunks.append(text + '\n')
             self.log_output(text)
 
-        log_print("🔍 Raw ANSI Analyzer")
-        log_print("=" * 60)
-        log_print(f"📝 Command: {command}")
-        log_print(f"🚀 Exit Code: {returncode}")
-        log_print(f"📏 Raw Length: {len(raw_output)} characters")
-        log_print()
-
-        # Process with ANSIProcessor
-        processed_output = self.processor.process_ansi_sequences(raw_output)
-        stripped_output = self.processor.strip_ansi(raw_output)
-
-        # Get real terminal output using echo
-        real_terminal_output = None
-        if show_real_terminal:
-            real_terminal_output = self.get_real_terminal_output(raw_output)
-
-        # Find ANSI sequences
-        sequences = self.find_ansi_sequences(raw_output)
-
-        log_print(f"🎨 ANSI Sequences Found: {len(sequences)}")
-        if sequences:
-            log_print("┌─ Sequence Analysis ─────────────────────────────────────┐")
-            for i, seq_info in enumerate(sequences[:10], 1):  # Show first 10
-                log_print(f"│ {i:2d}. {seq_info['repr']:<20} → {seq_info['description']}")
-            if len(sequences) > 10:
-                log_print(f"│     ... and {len(sequences) - 10} more sequences")
-            log_print("└────────────────────────────────────────────────────────┘")
-        log_print()
-
-        def format_output_section(title, content, max_lines=None):
-            """Format an output section showing all content"""
-            log_print(f"{title}:")
-            log_print("┌───────────────────────────────────────────────────────────┐")
-
-            if not content:
-                log_print("│ (empty)")
-            else:
-                content_repr = repr(content)
+        # Flush even if a step below raises, so partial diagnostics still reach the console
+        try:
+            log_print("🔍 Raw ANSI Analyzer")
+            log_print("=" * 60)
+            log_print(f"📝 Command: {command}")
+            log_print(f"🚀 Exit Code: {returncode}")
+            log_print(f"📏 Raw Length: {len(raw_output)} characters")
+            log_print()
 
-                # Handle multi-line display - show all lines
-                if '\n' in content:
-                    lines = content.split('\n')
+            # Process with ANSIProcessor
+            processed_output = self.processor.process_ansi_sequences(raw_output)
+            stripped_output = self.processor.strip_ansi(raw_output)
+
+            # Find ANSI sequences
+            sequences = self.find_ansi_sequences(raw_output)
+
+            log_print(f"🎨 ANSI Sequences Found: {len(sequences)}")
+            if sequences:
+                log_print("┌─ Sequence Analysis ─────────────────────────────────────┐")
+                for i, seq in enumerate(sequences[:10], 1):  # Show first 10
+                    seq_info = self.annotate_sequence(seq)
+                    log_print(f"│ {i:2d}. {seq_info['repr']:<20} → {seq_info['description']}")
+                if len(sequences) > 10:
+                    log_print(f"│     ... and {len(sequences) - 10} more sequences")
+                log_print("└────────────────────────────────────────────────────────┘")
+            log_print()
 
-                    for line in lines:
-                        line_repr = repr(line)
-                        log_print(f"│ {line_repr}")
+            def format_output_section(title, content, max_lines=None):
+                """Format an output section showing all content"""
+                log_print(f"{title}:")
+                log_print("┌───────────────────────────────────────────────────────────┐")
+
+                if not content:
+                    log_print("│ (empty)")
+                elif '\n' in content:
+                    # Handle multi-line display - show all lines
+                    for line in content.split('\n'):
+                        log_print(f"│ {repr(line)}")
                 else:
-                    log_print(f"│ {content_repr}")
+                    log_print(f"│ {repr(content)}")
 
-            log_print("└──────────────────────────────────────────────────────────┘")
-            log_print()
+                log_print("└──────────────────────────────────────────────────────────┘")
+                log_print()
 
-        # Raw output
-        format_output_section("📜 Raw Output (with ANSI sequences)", raw_output)
-
-        # Real terminal output (using echo)
-        if show_real_terminal and real_terminal_output is not None:
-            format_output_section("🖥️  Real Terminal Output (echo rendered)", real_terminal_output)
-
-        # Processed output
-        format_output_section("🎯 Processed Output (ANSIProcessor result)", processed_output)
-
-        # Stripped output
-        format_output_section("🧹 Stripped Output (ANSI sequences removed)", stripped_output)
-
-        # Enhanced comparison
-        if show_compare:
-            log_print("⚖️  Comparison:")
-            log_print(f"│ Raw == Processed: {raw_output == processed_output}")
-            log_print(f"│ Raw == Stripped:  {raw_output == stripped_output}")
-            log_print(f"│ Processed == Stripped: {processed_output == stripped_output}")
-            if real_terminal_output is not None:
-                log_print(f"│ Real Terminal == Processed: {real_terminal_output == processed_output}")
-                log_print(f"│ Real Terminal == Stripped: {real_terminal_output == stripped_output}")
-                if real_terminal_output == processed_output:
-                    log_print("│ 🎉 ANSIProcessor matches real terminal output!")
-                else:
-                    log_print("│ ⚠️  ANSIProcessor differs from real terminal output")
-            log_print(f"│ Processing Changed Output: {raw_output != processed_output}")
-            log_print()
+            # Raw output
+            format_output_section("📜 Raw Output (with ANSI sequences)", raw_output)
 
-        # Hex dump
-        if show_hex:
-            log_print("🔍 Hex Dump:")
-            log_print("┌─ Hex Dump ────────────────────────────────────────────────┐")
-            hex_lines = self.format_hex_dump(raw_output).split('\n')
-            for line in hex_lines:  # Show all hex lines
-                log_print(f"│ {line}")
-            log_print("└──────────────────────────────────────────────────────┘")
-            log_print()
+            # Processed output
+            format_output_section("🎯 Processed Output (ANSIProcessor result)", processed_output)
 
-        # Visual output - show what the terminal displays
-        self.show_visual_output(raw_output, processed_output, log_print)
+            # Stripped output
+            format_output_section("🧹 Stripped Output (ANSI sequences removed)", stripped_output)
 
-        log_print()
-        if show_real_terminal:
-            log_print("💡 Use --hex for hex dump, --no-compare to skip comparison, --no-real-terminal to skip echo rendering")
-        else:
-            log_print("💡 Use --hex for hex dump, --no-compare to skip comparison, --real-terminal to enable echo rendering")
+            # Enhanced comparison
+            if show_compare:
+                log_print("⚖️  Comparison:")
+                log_print(f"│ Raw == Processed: {raw_output == processed_output}")
+                log_print(f"│ Raw == Stripped:  {raw_output == stripped_output}")
+                log_print(f"│ Processed == Stripped: {processed_output == stripped_output}")
+                log_print(f"│ Processing Changed Output: {raw_output != processed_output}")
+                log_print()
+
+            # Hex dump
+            if show_hex:
+                log_print("🔍 Hex Dump:")
+                log_print("┌─ Hex Dump ────────────────────────────────────────────────┐")
+                for line in self.iter_hex_dump(raw_output):  # Show all hex lines
+                    log_print(f"│ {line}")
+                log_print("└──────────────────────────────────────────────────────┘")
+                log_print()
 
-        # Add note about commands that may not produce ANSI when captured
-        if len(sequences) == 0 and len(raw_output) > 50:
-            log_print("📝 Note: Some commands (like ls --color) may not produce ANSI codes when run via pty.")
-            log_print("   Try explicit ANSI sequences with echo -e for testing ANSI processing.")
+            # Visual output - show what the terminal displays
+            self.show_visual_output(raw_output, processed_output, log_print)
+
+            log_print()
+            log_print("💡 Use --hex for hex dump, --no-compare to skip comparison")
+
+            # Add note about commands that may not produce ANSI when captured
+            if len(sequences) == 0 and len(raw_output) > 50:
+                log_print("📝 Note: Some commands (like ls --color) may not produce ANSI codes when run via pty.")
+                log_print("   Try explicit ANSI sequences with echo -e for testing ANSI processing.")
+        finally:
+            self._flush_output()
 
         # Write log file if logging is enabled
         if self.enable_logging:
@@ -662,7 +701,7 @@ Examples:
   rawansi "ls --color=always"
   rawansi "git status --color=always"
   rawansi --hex "echo -e '\\033[31mRed\\033[0m'"
-  rawansi --real-terminal "echo -e '\\033[6;11HTest\\033[1;1H'"
+  rawansi "echo -e '\\033[6;11HTest\\033[1;1H'"
   rawansi --timeout 10 "ps aux | head -5"
   rawansi "tput cup 5 10; echo 'Positioned'; tput cup 0 0"
   rawansi --interactive "sh"
@@ -673,7 +712,6 @@ Perfect for:
   - Understanding what real commands output
   - Creating test cases for ANSIProcessor
   - Analyzing terminal application behavior
-  - Validating ANSIProcessor against real terminal behavior
         """
     )
 
@@ -697,13 +735,13 @@ Perfect for:
     parser.add_argument(
         '--real-terminal',
         action='store_true',
-        help='Enable real terminal output using echo (default: enabled)'
+        help='Deprecated, has no effect (kept for compatibility)'
     )
 
     parser.add_argument(
         '--no-real-terminal',
         action='store_true',
-        help='Disable real terminal output rendering'
+        help='Deprecated, has no effect (kept for compatibility)'
     )
 
     parser.add_argument(
@@ -721,13 +759,6 @@ Perfect for:
 
     args = parser.parse_args()
 
-    # Determine if real terminal output should be shown
-    show_real_terminal = True  # Default to enabled
-    if args.no_real_terminal:
-        show_real_terminal = False
-    elif args.real_terminal:
-        show_real_terminal = True
-
     # Create capture instance
     capture = RawANSICapture(timeout=args.timeout, interactive_mode=args.interactive)
 
@@ -740,8 +771,6 @@ Perfect for:
     # Execute command and capture output (normal mode)
     print(f"🚀 Executing: {args.command}")
     print("⏳ Capturing raw ANSI output...")
-    if show_real_terminal:
-        print("🖥️  Will render with real terminal (echo)...")
     print()
 
     raw_output, returncode = capture.capture_command_output(args.command)
@@ -752,8 +781,7 @@ Perfect for:
         raw_output,
         returncode,
         show_hex=args.hex,
-        show_compare=not args.no_compare,
-        show_real_terminal=show_real_terminal
+        show_compare=not args.no_compare
     )
 
 if __name__ == "__main__":